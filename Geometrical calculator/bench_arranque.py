@@ -0,0 +1,71 @@
+# ==============================
+# Benchmark de importación y arranque del núcleo
+# ==============================
+# Mide, en procesos nuevos (como los workers de vida corta):
+# - lo que tarda Python vacío,
+# - lo que añade `import shapelang`,
+# - lo que añade además ejecutar un programa corto,
+# - el tiempo acumulado de shapelang según `python -X importtime`,
+# y comprueba que el núcleo no arrastra tkinter, re, threading ni asyncio.
+# Con PYTHONDONTWRITEBYTECODE=1 no hay .pyc y cada import incluye compilar el
+# fuente: los números de un despliegue normal son los de con caché de bytecode.
+#
+# Uso:
+#   python bench_arranque.py [repeticiones]
+
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+AQUI = os.path.dirname(os.path.abspath(__file__))
+
+PROGRAMA = "heptagono_blanco_print barra_negra_vertical 5 circulo_negro 5 barra_blanca_vertical"
+
+CASOS = [
+    ("python vacío", "pass"),
+    ("import shapelang", "import shapelang"),
+    ("import + PRINT", f"import shapelang; shapelang.Interpreter(output_cb=lambda v: None).run({PROGRAMA!r})"),
+]
+
+def tiempo_proceso(codigo, n):
+    """Mediana (ms) de lanzar `python -c codigo` n veces."""
+    muestras = []
+    for _ in range(n):
+        t0 = time.perf_counter()
+        subprocess.run([sys.executable, "-c", codigo], cwd=AQUI, check=True)
+        muestras.append((time.perf_counter() - t0) * 1000)
+    return statistics.median(muestras)
+
+def importtime_shapelang():
+    """Tiempo acumulado (ms) de `import shapelang` según -X importtime."""
+    res = subprocess.run([sys.executable, "-X", "importtime", "-c", "import shapelang"],
+                         cwd=AQUI, check=True, capture_output=True, text=True)
+    for linea in res.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        partes = [p.strip() for p in linea.split("|")]
+        if len(partes) == 3 and partes[2] == "shapelang":
+            return int(partes[1]) / 1000
+    return None
+
+def modulos_pesados():
+    codigo = ("import sys, shapelang; print(' '.join(m for m in ('tkinter', 're', 'threading', "
+              "'asyncio', 'hashlib') if m in sys.modules))")
+    res = subprocess.run([sys.executable, "-c", codigo], cwd=AQUI, check=True,
+                         capture_output=True, text=True)
+    return res.stdout.split()
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    base = None
+    for nombre, codigo in CASOS:
+        ms = tiempo_proceso(codigo, n)
+        base = ms if base is None else base
+        print(f"{nombre:<18} {ms:7.2f} ms   (+{ms - base:.2f} ms)")
+    print(f"{'-X importtime':<18} {importtime_shapelang():7.2f} ms   (acumulado de shapelang)")
+    pesados = modulos_pesados()
+    print("módulos pesados cargados:", ", ".join(pesados) if pesados else "ninguno")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,159 @@
+# ==============================
+# GUI (Tkinter) de la VM de Figuras: fondo negro y dibujo por dígitos
+# ==============================
+# Separado del núcleo: tkinter solo se importa al abrir la ventana.
+# Las figuras por dígito se calculan en shapelang/render.py (también sirve sin Tk).
+
+from shapelang import Interpreter, VMExpr
+from shapelang.salida import write_value
+
+GUI_MAX_DIGITS = 10000  # más dígitos que esto no caben con soltura en el Text
+
+def launch_gui():
+    import tkinter as tk
+    from shapelang.render import TkSink, layout_digits, render, text_digits, value_text
+
+    # --- Ventana base (negro) ---
+    root = tk.Tk()
+    root.title("VM Figuras")
+    root.configure(bg="black")
+    root.geometry("980x640")
+    root.minsize(900, 560)
+
+    # Utilidades de estilo rápido
+    def mk_label(parent, text, size=11, bold=False):
+        font = ("Segoe UI", size, "bold" if bold else "normal")
+        return tk.Label(parent, text=text, fg="white", bg="black", font=font)
+
+    def mk_button(parent, text, cmd=None):
+        return tk.Button(parent, text=text, command=cmd, fg="white", bg="#222222",
+                         activebackground="#333333", activeforeground="white",
+                         relief="flat", padx=10, pady=6)
+
+    # --- Layout superior: Entrada y Botones ---
+    top = tk.Frame(root, bg="black")
+    top.pack(fill="x", padx=12, pady=10)
+
+    mk_label(top, "QUE OPERACION DESEAS REALIZAR?", size=12, bold=True).pack(anchor="w", pady=(0,6))
+
+    input_box = tk.Text(top, height=4, wrap="word",
+                        fg="white", bg="#111111", insertbackground="white",
+                        relief="flat", padx=8, pady=8)
+    input_box.pack(fill="x", expand=False)
+    input_box.insert("1.0", "heptagono_blanco_print barra_negra_vertical 5 circulo_negro 5 barra_blanca_vertical")
+
+    btn_row = tk.Frame(top, bg="black")
+    btn_row.pack(fill="x", pady=8)
+    btn_ejecutar = mk_button(btn_row, "Ejecutar")
+    btn_reiniciar = mk_button(btn_row, "Reiniciar VM")
+    btn_limpiar = mk_button(btn_row, "Limpiar salida")
+    btn_ejecutar.pack(side="left")
+    btn_reiniciar.pack(side="left", padx=8)
+    btn_limpiar.pack(side="left")
+
+    # --- Zona central: Salida (texto) y Polígono (canvas) ---
+    middle = tk.Frame(root, bg="black")
+    middle.pack(fill="both", expand=True, padx=12, pady=(0,12))
+
+    # Columna izquierda: salida
+    left = tk.Frame(middle, bg="black")
+    left.pack(side="left", fill="both", expand=True, padx=(0,6))
+
+    mk_label(left, "Salida:", size=12, bold=True).pack(anchor="w")
+    output_box = tk.Text(left, height=10, wrap="word",
+                         fg="white", bg="#111111", insertbackground="white",
+                         relief="flat", padx=8, pady=8)
+    output_box.pack(fill="both", expand=True)
+
+    # Columna derecha: polígono
+    right = tk.Frame(middle, bg="black")
+    right.pack(side="left", fill="both", expand=True, padx=(6,0))
+
+    mk_label(right, "Polígono:", size=12, bold=True).pack(anchor="w")
+    canvas = tk.Canvas(right, bg="black", highlightthickness=0)
+    canvas.pack(fill="both", expand=True)
+
+    # ---- Salida helper
+    def append_output(msg):
+        # enteros enormes: a trozos y, pasados GUI_MAX_DIGITS, solo extremos
+        write_value(msg, lambda s: output_box.insert("end", s), max_full=GUI_MAX_DIGITS)
+        output_box.insert("end", "\n")
+        output_box.see("end")
+
+    # ---- VM con callback de salida
+    vm = Interpreter(output_cb=append_output)
+    # Decimal del último valor dibujado: (valor, drawable, (texto, avisos)). Al
+    # redimensionar se redibuja el mismo valor sin volver a convertirlo.
+    dibujado = [None, None, None]
+
+    # ==========================
+    # DIBUJO DE POLÍGONOS (layout en render.py, pintado en el canvas)
+    # ==========================
+
+    def clear_canvas():
+        canvas.delete("all")
+
+    def draw_value(val, drawable=None, avisar=True):
+        """Dibuja según la regla. Val debe ser numérico.
+        drawable es la pista de infer_types (ver value_digits): el valor se
+        comprueba igualmente. Solo se dibujan los dígitos que caben
+        en el canvas; con avisar=False no se repiten los avisos (redibujos)."""
+        clear_canvas()
+        w = canvas.winfo_width() or 400
+        h = canvas.winfo_height() or 300
+        if dibujado[0] is not val or dibujado[1] != drawable:
+            dibujado[:] = [val, drawable, value_text(val, drawable)]
+        texto, avisos = dibujado[2]
+        shapes = []
+        if texto is not None:
+            digits, recorte = text_digits(texto, w)
+            avisos = avisos + recorte
+            shapes = layout_digits(digits, w, h)
+        if avisar:
+            for aviso in avisos:
+                append_output(aviso)
+        render(shapes, TkSink(canvas))
+
+    # ---- Handlers de botones
+    def on_ejecutar():
+        code = input_box.get("1.0", "end").strip()
+        if not code:
+            return
+        try:
+            vm.last_printed_value = None
+            vm.run(code)
+            val = vm.last_printed_value
+            if val is not None:
+                draw_value(val, vm.last_printed_drawable)
+            else:
+                append_output("[Info] No se ha llamado a PRINT: no hay resultado para dibujar.")
+                clear_canvas()
+        except Exception as e:
+            append_output(f"Error: {e}")
+            clear_canvas()
+
+    def on_reiniciar():
+        vm.env.clear()
+        vm.exprvm = VMExpr(vm.env, vm.exprvm.traza)
+        vm.last_printed_value = None
+        vm.last_printed_drawable = None
+        dibujado[:] = [None, None, None]
+        append_output("[VM reiniciada: variables borradas]")
+        clear_canvas()
+
+    def on_limpiar():
+        output_box.delete("1.0", "end")
+        clear_canvas()
+
+    btn_ejecutar.configure(command=on_ejecutar)
+    btn_reiniciar.configure(command=on_reiniciar)
+    btn_limpiar.configure(command=on_limpiar)
+
+    # Redibujar al cambiar de tamaño
+    def on_resize(event):
+        if vm.last_printed_value is not None:
+            draw_value(vm.last_printed_value, vm.last_printed_drawable, avisar=False)
+
+    canvas.bind("<Configure>", on_resize)
+
+    root.mainloop()
@@ -0,0 +1,17 @@
+# ==============================
+# Shapelang: núcleo de la VM de figuras (sin GUI)
+# ==============================
+# lexer -> parser (AST de nodos) -> inferencia de tipos -> evaluación por nodos
+# o por código plano (Run: pausable y con checkpoints).
+#
+# Importar el paquete solo carga el núcleo. Los módulos opcionales se importan
+# aparte: shapelang.traza (trazas), shapelang.checkpoint (se carga solo al usar
+# checkpoints) y shapelang.render (dibujo a Tk/SVG/PPM/PBM).
+
+from .lexer import TOKENS, SYMS, Ident, lex
+from .expr import OPERADORES, OPS, Num, Op, Var, VMExpr, rpn_to_infix, to_rpn
+from .nodes import Block, Expr, For, If, Print, Set, While
+from .parser import Parser
+from .tipos import BOOL, FLOAT, INT, infer_types
+from .flat import Run, Scheduler, compile_program
+from .interpreter import Interpreter
@@ -0,0 +1,102 @@
+# ==============================
+# Checkpoints del intérprete
+# ==============================
+# Un checkpoint guarda dónde va una ejecución sobre código plano (ver Run en flat.py):
+# - hash del programa (para no reanudar con otro código),
+# - contador de programa (pc) y pasos ejecutados,
+# - estado de los bucles: último valor y la pila de valores guardados del FOR,
+# - env con las variables.
+# Se serializa con marshal (binario, los enteros grandes van en base 2^30, no en
+# decimal) y se escribe de forma atómica (archivo temporal + os.replace).
+#
+# La escritura va en un hilo aparte: el bucle del intérprete solo copia el estado
+# y sigue. Si llegan checkpoints más rápido de lo que se escriben, solo se
+# escribe el más reciente.
+
+import hashlib
+import marshal
+import os
+import threading
+
+MAGIC = b"MVCK"
+VERSION = 1
+
+def program_hash(code_str):
+    return hashlib.sha256(code_str.encode("utf-8")).digest()
+
+def dumps(state):
+    payload = (VERSION, state["hash"], state["pc"], state["steps"],
+               state["last"], tuple(state["saved"]), state["env"])
+    return MAGIC + marshal.dumps(payload)
+
+def loads(data):
+    if data[:len(MAGIC)] != MAGIC:
+        raise ValueError("No es un checkpoint de la VM")
+    payload = marshal.loads(data[len(MAGIC):])
+    if payload[0] != VERSION:
+        raise ValueError(f"Versión de checkpoint no soportada: {payload[0]}")
+    _, h, pc, steps, last, saved, env = payload
+    return {"hash": h, "pc": pc, "steps": steps, "last": last,
+            "saved": list(saved), "env": env}
+
+def save(path, state):
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(dumps(state))
+    os.replace(tmp, path)
+
+def load(path):
+    with open(path, "rb") as f:
+        return loads(f.read())
+
+
+class CheckpointWriter:
+    """Escribe checkpoints en segundo plano. submit() no bloquea."""
+
+    def __init__(self, path):
+        self.path = path
+        self.written = 0
+        self._pending = None
+        self._closing = False
+        self._error = None
+        self._cond = threading.Condition()
+        self._thread = threading.Thread(target=self._loop, name="checkpoint", daemon=True)
+        self._thread.start()
+
+    def submit(self, state):
+        with self._cond:
+            if self._error is not None:
+                raise self._error
+            self._pending = state
+            self._cond.notify()
+
+    def _loop(self):
+        while True:
+            with self._cond:
+                while self._pending is None and not self._closing:
+                    self._cond.wait()
+                state, self._pending = self._pending, None
+                if state is None:
+                    return
+            try:
+                save(self.path, state)
+                self.written += 1
+            except Exception as e:  # se relanza en el hilo del intérprete
+                with self._cond:
+                    self._error = e
+                return
+
+    def close(self):
+        """Espera a que se escriba el último checkpoint pendiente."""
+        with self._cond:
+            self._closing = True
+            self._cond.notify()
+        self._thread.join()
+        if self._error is not None:
+            raise self._error
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,157 @@
+# ==============================
+# Expresiones: operadores, RPN y evaluación
+# ==============================
+
+from .lexer import Ident
+
+# ---------- Operadores y precedencias (para expresiones) ---------- precedencia asociatividad ariedad funcion
+OPERADORES = {
+    "+":  (2, "left", 2, lambda a, b: a + b),
+    "-":  (2, "left", 2, lambda a, b: a - b),
+    "*":  (3, "left", 2, lambda a, b: a * b),
+    "/":  (3, "left", 2, lambda a, b: a / b),
+    "%":  (3, "left", 2, lambda a, b: a % b),
+    "//": (3, "left", 2, lambda a, b: a // b),
+    "**": (4, "right", 2, lambda a, b: a ** b),
+    ">":  (1, "left", 2, lambda a, b: a > b),
+    "<":  (1, "left", 2, lambda a, b: a < b),
+    "!=": (1, "left", 2, lambda a, b: a != b),
+}
+
+# ---------- Elementos de la RPN ---------- cada uno sabe aplicarse sobre la pila
+class Num:
+    __slots__ = ("value",)
+    sym = "NUM"
+    pops = 0
+
+    def __init__(self, value):
+        self.value = value
+
+    def run(self, st, env):
+        st.append(self.value)
+
+
+class Var:
+    __slots__ = ("name",)
+    sym = "ID"
+    pops = 0
+
+    def __init__(self, name):
+        self.name = name
+
+    def run(self, st, env):
+        try:
+            st.append(env[self.name])
+        except KeyError:
+            raise NameError(f"Variable no definida: {self.name}") from None
+
+
+class Op:
+    __slots__ = ("sym", "fn")
+    pops = 2
+
+    def __init__(self, sym, fn):
+        self.sym = sym
+        self.fn = fn
+
+    def run(self, st, env):
+        b = st.pop()
+        st.append(self.fn(st.pop(), b))
+
+
+# Un solo Op por operador: la RPN comparte las instancias
+OPS = {sym: Op(sym, spec[3]) for sym, spec in OPERADORES.items()}
+
+def to_rpn(tokens, var_table=None):
+    """Shunting-yard: infijo -> RPN    reorganiza los tokens de una expresion usando una pila de operadores. 
+    IDs directos a la salida y Operadores se comparan arriba de la fila. Al final se vacia la pila.
+    var_table (nombre -> Var) lo comparte quien parsea un programa entero, p.ej. el Parser """
+    if var_table is None:
+        var_table = {}
+    out, stack = [], []
+    for t in tokens:
+        if isinstance(t, (int, float)):
+            out.append(Num(t))
+        elif isinstance(t, Ident):
+            out.append(var_table.get(t.name) or var_table.setdefault(t.name, Var(t.name)))
+        elif isinstance(t, tuple) and t[0] == "ID":  # forma antigua ('ID', nombre)
+            out.append(var_table.get(t[1]) or var_table.setdefault(t[1], Var(t[1])))
+        elif t in OPERADORES:
+            p1, assoc1 = OPERADORES[t][0], OPERADORES[t][1]
+            while stack and stack[-1] in OPERADORES:
+                p2 = OPERADORES[stack[-1]][0]
+                if (assoc1 == "left" and p1 <= p2) or (assoc1 == "right" and p1 < p2):
+                    out.append(OPS[stack.pop()]); continue
+                break
+            stack.append(t)
+        elif t == "(":
+            stack.append(t)
+        elif t == ")":
+            while stack and stack[-1] != "(":
+                out.append(OPS[stack.pop()])
+            if not stack:
+                raise SyntaxError("Paréntesis desbalanceados")
+            stack.pop()
+        else:
+            raise SyntaxError(f"Token inesperado en expresión: {t}")
+    while stack:
+        op = stack.pop()
+        if op in ("(", ")"):
+            raise SyntaxError("Paréntesis desbalanceados")
+        out.append(OPS[op])
+    return out
+
+def rpn_to_infix(rpn):
+    """RPN -> lista de tokens infijos en la forma antigua (números, ('ID', nombre), símbolos).
+    Solo se ponen los paréntesis que exige la precedencia. La RPN mal formada
+    (p.ej. "1 +", que el parser acepta y falla al evaluarse) no lanza error: a los
+    operadores sin operandos suficientes se les deja el hueco vacío."""
+    st = []  # (tokens, precedencia); los átomos no necesitan paréntesis
+    for it in rpn:
+        if isinstance(it, Num):
+            st.append(([it.value], 99))
+        elif isinstance(it, Var):
+            st.append(([("ID", it.name)], 99))
+        else:
+            prec, assoc = OPERADORES[it.sym][0], OPERADORES[it.sym][1]
+            if len(st) >= 2:
+                (b, pb), (a, pa) = st.pop(), st.pop()
+            else:  # faltan operandos: el que haya va a la izquierda
+                (a, pa), (b, pb) = (st.pop() if st else ([], 99)), ([], 99)
+            if pa < prec or (pa == prec and assoc == "right"):
+                a = ["(", *a, ")"]
+            if pb < prec or (pb == prec and assoc == "left"):
+                b = ["(", *b, ")"]
+            st.append((a + [it.sym] + b, prec))
+    return [t for toks, _ in st for t in toks]
+
+# ---------- Evaluación de expresiones ---------- evalua la rpn con una pila 
+class VMExpr:
+    def __init__(self, env, traza=None):
+        self.env = env
+        self.traza = traza  # Traza opcional (traza.py): registra cada paso
+
+    def eval_rpn(self, rpn):
+        if self.traza is not None:
+            return self._eval_rpn_traza(rpn)
+        st = []
+        env = self.env
+        for it in rpn:
+            it.run(st, env)
+        return st[-1] if st else None
+
+    def _eval_rpn_traza(self, rpn):
+        """Igual que eval_rpn, pero anotando cada operación en la traza."""
+        traza = self.traza
+        st = []
+        env = self.env
+        try:
+            for it in rpn:
+                it.run(st, env)
+                traza.paso(it.sym, it.pops, st[-1])
+        finally:
+            traza.fin()
+        return st[-1] if st else None
+
+    def eval_expr(self, toks):
+        return self.eval_rpn(to_rpn(toks))
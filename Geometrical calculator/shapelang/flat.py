@@ -0,0 +1,178 @@
+# ==============================
+# Código plano y ejecución por tramos
+# ==============================
+
+# ---------- Código plano ---------- el AST se aplana en instrucciones con saltos para
+# poder parar en cualquier punto (pc) y guardar/retomar el estado (checkpoint.py)
+I_SET, I_PRINT, I_JF, I_JMP, I_NONE, I_SAVE, I_RESTORE = range(7)
+
+def compile_program(ast):
+    """AST -> lista de instrucciones (op, a, b). El valor de la última sentencia
+    (lo que devuelve run) se lleva en un registro: SET/PRINT lo escriben, NONE lo
+    borra y SAVE/RESTORE lo protegen mientras corre el post de un FOR."""
+    code = []
+    ast.compile(code)
+    return code
+
+
+class Run:
+    """Una ejecución sobre código plano: pc, registro de último valor, valores
+    guardados por los FOR y pasos (instrucciones) ejecutados.
+    También se puede llevar a tramos desde un bucle de eventos: advance(n),
+    slices(n) (generador), run_async(n) (asyncio) o un Scheduler.
+    Las variables y el último PRINT son los del Interpreter (vm.env,
+    vm.last_printed_value), no de la ejecución: un Interpreter por programa."""
+
+    def __init__(self, vm, code, pc=0, last=None, saved=None, steps=0):
+        self.vm = vm
+        self.code = code
+        self.pc = pc
+        self.last = last
+        self.saved = saved if saved is not None else []
+        self.steps = steps
+        self.paused = False
+        self.cancelled = False
+        self.error = None
+        self._wake = None  # asyncio.Event mientras run_async espera en pausa
+
+    @property
+    def done(self):
+        return self.pc >= len(self.code)
+
+    @property
+    def env(self):
+        """El env del Interpreter, compartido con vm.run y con cualquier otra ejecución."""
+        return self.vm.env
+
+    @property
+    def finished(self):
+        return self.done or self.cancelled or self.error is not None
+
+    @property
+    def status(self):
+        if self.error is not None:
+            return "error"
+        if self.cancelled:
+            return "cancelled"
+        if self.done:
+            return "done"
+        return "paused" if self.paused else "running"
+
+    # ---------- Control ----------
+    def pause(self):
+        self.paused = True
+
+    def resume(self):
+        self.paused = False
+        self._wakeup()
+
+    def cancel(self):
+        self.cancelled = True
+        self._wakeup()
+
+    def _wakeup(self):
+        if self._wake is not None:
+            self._wake.set()
+
+    # ---------- Ejecución cooperativa ----------
+    def advance(self, n):
+        """Un tramo de como mucho n instrucciones, salvo si está en pausa o
+        terminada. Un error queda en self.error y se relanza. Devuelve finished."""
+        if self.paused or self.finished:
+            return self.finished
+        try:
+            self.step(n)
+        except Exception as e:
+            self.error = e
+            raise
+        return self.finished
+
+    def slices(self, n=1000):
+        """Generador: cada next() ejecuta un tramo de n instrucciones. En pausa
+        cede sin avanzar. Al acabar devuelve (StopIteration.value) el último valor."""
+        while not self.finished:
+            self.advance(n)
+            yield self
+        return self.last
+
+    async def run_async(self, n=1000):
+        """Corrutina: un tramo de n instrucciones y cede el bucle de eventos.
+        En pausa espera a resume() o cancel() sin consumir CPU."""
+        import asyncio  # solo quien usa asyncio paga su importación
+        while not self.finished:
+            if self.paused:
+                self._wake = asyncio.Event()
+                await self._wake.wait()
+                self._wake = None
+                continue
+            self.advance(n)
+            await asyncio.sleep(0)
+        return self.last
+
+    def step(self, n):
+        """Ejecuta como mucho n instrucciones. Devuelve True si el programa terminó."""
+        code, end, saved = self.code, len(self.code), self.saved
+        env, eval_rpn, emit = self.vm.env, self.vm.exprvm.eval_rpn, self.vm.emit
+        pc, last, i = self.pc, self.last, 0
+        try:
+            while pc < end and i < n:
+                op, a, b = code[pc]
+                pc += 1
+                i += 1
+                if op == I_JF:
+                    if not eval_rpn(a):
+                        pc = b
+                elif op == I_SET:
+                    last = eval_rpn(b)
+                    env[a] = last
+                elif op == I_JMP:
+                    pc = a
+                elif op == I_PRINT:
+                    last = eval_rpn(a)
+                    emit(last, b)
+                elif op == I_NONE:
+                    last = None
+                elif op == I_SAVE:
+                    saved.append(last)
+                else:
+                    last = saved.pop()
+        except BaseException:
+            pc -= 1  # la instrucción que falló queda pendiente
+            i -= 1
+            raise
+        finally:
+            self.pc, self.last = pc, last
+            self.steps += i
+        return pc >= end
+
+    def state(self, program_hash):
+        """Copia del estado para un checkpoint (los valores son inmutables)."""
+        return {"hash": program_hash, "pc": self.pc, "steps": self.steps,
+                "last": self.last, "saved": list(self.saved), "env": dict(self.vm.env)}
+
+
+class Scheduler:
+    """Turnos para muchas ejecuciones en un solo hilo (p.ej. con root.after de Tk):
+    cada tick() da un tramo de n instrucciones a cada ejecución viva.
+    Cada ejecución debe venir de su propio Interpreter: dos del mismo compartirían
+    variables y se pisarían."""
+
+    def __init__(self, n=1000):
+        self.n = n
+        self.runs = []
+
+    def add(self, run):
+        if any(r.vm is run.vm for r in self.runs if not r.finished):
+            raise ValueError("Ya hay una ejecución viva de ese Interpreter: usa uno por programa")
+        self.runs.append(run)
+        return run
+
+    def tick(self):
+        """Un turno para todas. Devuelve cuántas siguen vivas (incluidas las pausadas)."""
+        for run in self.runs:
+            try:
+                run.advance(self.n)
+            except Exception:
+                pass  # queda en run.error; no para a las demás
+        self.runs = [r for r in self.runs if not r.finished]
+        return len(self.runs)
@@ -0,0 +1,113 @@
+# ==============================
+# Intérprete
+# ==============================
+
+import os
+import sys
+import time
+
+from .expr import VMExpr
+from .flat import Run, compile_program
+from .lexer import lex
+from .parser import Parser
+from .salida import write_value
+from .tipos import infer_types
+
+# ---------- Intérprete ---------- Coge los bloques del parser y les aplica la funcion que quede en medio
+class Interpreter:
+    def __init__(self, output_cb=None, traza=None, int_mode="full"):
+        self.env = {}
+        self.exprvm = VMExpr(self.env, traza)
+        self.int_mode = int_mode  # salida por defecto de enteros: "full", "count" o "edges"
+        self.output_cb = output_cb if output_cb is not None else self.print_value
+        self.last_printed_value = None  # guardamos el último valor impreso
+        self.last_printed_drawable = None  # True: int probado, False: bool probado
+        self._run = None  # ejecución de start() (una viva como mucho: comparten env)
+
+    def emit(self, val, drawable=None):
+        """Salida de PRINT: se recuerda el valor (y si es dibujable) y se pasa al callback."""
+        self.last_printed_value = val
+        self.last_printed_drawable = drawable
+        self.output_cb(val)
+
+    def print_value(self, val):
+        """Salida por defecto: como print(val), pero los enteros enormes se
+        convierten en tiempo subcuadrático y se escriben a trozos (salida.py)."""
+        write = sys.stdout.write
+        write_value(val, write, self.int_mode)
+        write("\n")
+
+    def eval_block(self, stmts):
+        last = None
+        for s in stmts:
+            last = self.eval_stmt(s)
+        return last
+
+    def eval_stmt(self, node):
+        return node.run(self)
+
+    def run(self, code_str):
+        tokens = lex(code_str)
+        ast = Parser(tokens).parse_program()
+        infer_types(ast, self.env)
+        return self.eval_stmt(ast)
+
+    def compile(self, code_str):
+        tokens = lex(code_str)
+        ast = Parser(tokens).parse_program()
+        infer_types(ast, self.env)
+        return compile_program(ast)
+
+    def start(self, code_str):
+        """Prepara una ejecución pausable (Run) sin ejecutar nada todavía.
+        Solo puede haber una viva por Interpreter: las ejecuciones comparten
+        self.env, así que para varios programas a la vez, un Interpreter cada uno."""
+        if self._run is not None and not self._run.finished:
+            raise RuntimeError("Este Interpreter ya tiene una ejecución en curso: "
+                               "termínala o cancélala, o usa otro Interpreter")
+        self._run = Run(self, self.compile(code_str))
+        return self._run
+
+    def run_checkpointed(self, code_str, path, every_steps=None, every_seconds=60.0):
+        """Como run, pero guardando checkpoints en `path` cada `every_steps`
+        instrucciones y/o cada `every_seconds` segundos. Al terminar bien se borra
+        el checkpoint. Si el proceso muere, resume() sigue desde el último."""
+        from . import checkpoint  # hashlib/threading solo si se usan checkpoints
+        run = Run(self, self.compile(code_str))
+        return self._run_with_checkpoints(run, checkpoint.program_hash(code_str), path,
+                                          every_steps, every_seconds)
+
+    def resume(self, code_str, path, every_steps=None, every_seconds=60.0):
+        """Reanuda desde el checkpoint `path` y sigue guardando checkpoints.
+        Los PRINT posteriores al último checkpoint se repiten."""
+        from . import checkpoint
+        state = checkpoint.load(path)
+        h = checkpoint.program_hash(code_str)
+        if state["hash"] != h:
+            raise ValueError("El checkpoint es de otro programa")
+        self.env.clear()
+        self.env.update(state["env"])
+        run = Run(self, self.compile(code_str), state["pc"], state["last"],
+                  state["saved"], state["steps"])
+        return self._run_with_checkpoints(run, h, path, every_steps, every_seconds)
+
+    def _run_with_checkpoints(self, run, h, path, every_steps, every_seconds):
+        # Se ejecuta por tramos; entre tramos se mira si toca checkpoint
+        from . import checkpoint
+        slice_n = min(every_steps or 1024, 1024) if every_seconds else (every_steps or 1024)
+        next_step = run.steps + every_steps if every_steps else None
+        next_time = time.monotonic() + every_seconds if every_seconds else None
+        with checkpoint.CheckpointWriter(path) as writer:
+            while not run.step(slice_n):
+                due = next_step is not None and run.steps >= next_step
+                if next_time is not None and time.monotonic() >= next_time:
+                    due = True
+                if due:
+                    writer.submit(run.state(h))
+                    if next_step is not None:
+                        next_step = run.steps + every_steps
+                    if next_time is not None:
+                        next_time = time.monotonic() + every_seconds
+        if run.done and os.path.exists(path):
+            os.remove(path)
+        return run.last
@@ -0,0 +1,83 @@
+# ==============================
+# Léxico y lexer
+# ==============================
+# Tablas precalculadas y sin expresiones regulares: importar este módulo no
+# hace trabajo aparte de crear los dicts/sets literales.
+
+# ---------- Léxico: nombres de figuras -> símbolos (lo que entiende el interprete))  ----------
+TOKENS = {
+    # Negras (columna izquierda)
+    "circulo_negro": "+",
+    "raya_negra": "-",
+    "triangulo_negro": "*",
+    "cuadrado_negro": "/",
+    "pentagono_negro": "%",
+    "hexagono_negro": "**",
+    "octagono_negro": "//",
+    "heptagono_negro": "!=",       # comparación distinta
+    "eneagono_negro": "=",         # asignación
+    "barra_negra_vertical": "(",   # paréntesis abierto
+    "barra_blanca_vertical": ")",  # paréntesis cerrado
+
+    # Blancas (columna derecha)
+    "circulo_blanco": ">",         # mayor que
+    "raya_blanca": "<",            # menor que
+    "triangulo_blanco_if": "IF",
+    "cuadrado_blanco_else": "ELSE",
+    "pentagono_blanco_while": "WHILE",
+    "hexagono_blanco_for": "FOR",
+    "heptagono_blanco_print": "PRINT",
+}
+
+SYMS = frozenset(TOKENS).union(TOKENS.values(), (";", "(", ")"))
+
+# Identificador: [A-Za-z_] seguido de alfanuméricos o _ (lo mismo que [A-Za-z_]\w*)
+ID_START = frozenset("ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz_")
+
+# ---------- Identificadores ----------
+class Ident:
+    """Token de identificador. Sustituye a la tupla ('ID', nombre) del lexer."""
+    __slots__ = ("name",)
+
+    def __init__(self, name):
+        self.name = name
+
+    def __repr__(self):
+        return f"Ident({self.name!r})"
+
+    def to_tuple(self):
+        return ("ID", self.name)
+
+# ---------- Lexer ---------- genera una lista clara de numeros identificadores y simbolos
+def lex(code: str):
+    """Convierte el programa en lista de tokens: números, Ident o símbolos."""
+    raw = code.replace("\n", " ").split()
+    out = []
+    idents = {}  # un solo Ident por nombre
+    for t in raw:
+        # permitir símbolos literales
+        if t in {"(", ")", ";"}:
+            out.append(t)
+            continue
+        # nombres de figura -> símbolo
+        if t in TOKENS:
+            out.append(TOKENS[t])
+            continue
+        # símbolo ya reconocido
+        if t in SYMS:
+            out.append(t)
+            continue
+        # número
+        try:
+            n = float(t) if "." in t else int(t)
+            out.append(n)
+            continue
+        except ValueError:
+            pass
+        # identificador
+        rest = t[1:].replace("_", "")
+        if t[0] in ID_START and (not rest or rest.isalnum()):
+            out.append(idents.setdefault(t, Ident(t)))
+            continue
+        raise SyntaxError(f"Token no reconocido: {t}")
+    return out
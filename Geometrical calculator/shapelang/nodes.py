@@ -0,0 +1,172 @@
+# ==============================
+# Nodos del AST
+# ==============================
+
+from .expr import rpn_to_infix, to_rpn
+from .flat import I_JF, I_JMP, I_NONE, I_PRINT, I_RESTORE, I_SAVE, I_SET
+
+# ---------- Nodos del AST ---------- cada sentencia lleva su propia evaluación (run)
+class Expr:
+    """Expresión ya convertida a RPN (los tokens infijos no se guardan)."""
+    __slots__ = ("rpn", "type")
+
+    def __init__(self, toks, var_table=None):
+        self.rpn = tuple(to_rpn(toks, var_table))
+        self.type = None  # lo rellena infer_types
+
+    def to_tuple(self):
+        return rpn_to_infix(self.rpn)
+
+
+class Block:
+    __slots__ = ("stmts",)
+
+    def __init__(self, stmts):
+        self.stmts = stmts
+
+    def run(self, vm):
+        last = None
+        for s in self.stmts:
+            last = s.run(vm)
+        return last
+
+    def to_tuple(self):
+        return ("BLOCK", [s.to_tuple() for s in self.stmts])
+
+    def compile(self, code):
+        if not self.stmts:
+            code.append((I_NONE, None, None))
+        for s in self.stmts:
+            s.compile(code)
+
+
+class Print:
+    __slots__ = ("expr", "drawable")
+
+    def __init__(self, expr):
+        self.expr = expr
+        self.drawable = None  # True/False si infer_types probó int/bool
+
+    def run(self, vm):
+        val = vm.exprvm.eval_rpn(self.expr.rpn)
+        vm.emit(val, self.drawable)
+        return val
+
+    def to_tuple(self):
+        return ("PRINT", self.expr.to_tuple())
+
+    def compile(self, code):
+        code.append((I_PRINT, self.expr.rpn, self.drawable))
+
+
+class Set:
+    __slots__ = ("name", "expr")
+
+    def __init__(self, name, expr):
+        self.name = name
+        self.expr = expr
+
+    def run(self, vm):
+        val = vm.exprvm.eval_rpn(self.expr.rpn)
+        vm.env[self.name] = val
+        return val
+
+    def to_tuple(self):
+        return ("SET", self.name, self.expr.to_tuple())
+
+    def compile(self, code):
+        code.append((I_SET, self.name, self.expr.rpn))
+
+
+class If:
+    __slots__ = ("cond", "then_blk", "else_blk")
+
+    def __init__(self, cond, then_blk, else_blk):
+        self.cond = cond
+        self.then_blk = then_blk
+        self.else_blk = else_blk
+
+    def run(self, vm):
+        if vm.exprvm.eval_rpn(self.cond.rpn):
+            return self.then_blk.run(vm)
+        elif self.else_blk is not None:
+            return self.else_blk.run(vm)
+        return None
+
+    def to_tuple(self):
+        else_t = self.else_blk.to_tuple() if self.else_blk is not None else None
+        return ("IF", self.cond.to_tuple(), self.then_blk.to_tuple(), else_t)
+
+    def compile(self, code):
+        jf = len(code)
+        code.append(None)
+        self.then_blk.compile(code)
+        jmp = len(code)
+        code.append(None)
+        code[jf] = (I_JF, self.cond.rpn, len(code))
+        if self.else_blk is not None:
+            self.else_blk.compile(code)
+        else:
+            code.append((I_NONE, None, None))
+        code[jmp] = (I_JMP, len(code), None)
+
+
+class While:
+    __slots__ = ("cond", "body")
+
+    def __init__(self, cond, body):
+        self.cond = cond
+        self.body = body
+
+    def run(self, vm):
+        eval_rpn, cond, body = vm.exprvm.eval_rpn, self.cond.rpn, self.body
+        out = None
+        while eval_rpn(cond):
+            out = body.run(vm)
+        return out
+
+    def to_tuple(self):
+        return ("WHILE", self.cond.to_tuple(), self.body.to_tuple())
+
+    def compile(self, code):
+        code.append((I_NONE, None, None))
+        top = len(code)
+        code.append(None)
+        self.body.compile(code)
+        code.append((I_JMP, top, None))
+        code[top] = (I_JF, self.cond.rpn, len(code))
+
+
+class For:
+    __slots__ = ("init", "cond", "post", "body")
+
+    def __init__(self, init, cond, post, body):
+        self.init = init
+        self.cond = cond
+        self.post = post
+        self.body = body
+
+    def run(self, vm):
+        eval_rpn, cond, post, body = vm.exprvm.eval_rpn, self.cond.rpn, self.post, self.body
+        self.init.run(vm)
+        out = None
+        while eval_rpn(cond):
+            out = body.run(vm)
+            post.run(vm)
+        return out
+
+    def to_tuple(self):
+        return ("FOR", self.init.to_tuple(), self.cond.to_tuple(),
+                self.post.to_tuple(), self.body.to_tuple())
+
+    def compile(self, code):
+        self.init.compile(code)
+        code.append((I_NONE, None, None))
+        top = len(code)
+        code.append(None)
+        self.body.compile(code)
+        code.append((I_SAVE, None, None))  # post no cuenta como valor del FOR
+        self.post.compile(code)
+        code.append((I_RESTORE, None, None))
+        code.append((I_JMP, top, None))
+        code[top] = (I_JF, self.cond.rpn, len(code))
@@ -0,0 +1,105 @@
+# ==============================
+# Parser de sentencias / bloques
+# ==============================
+
+from .lexer import Ident
+from .nodes import Block, Expr, For, If, Print, Set, While
+
+# ---------- Parser de sentencias / bloques ---------- se utiliza para todas las condiciones, se forman bloques y se les pasa las condiciones
+class Parser:
+    def __init__(self, tokens):
+        self.t = tokens
+        self.i = 0
+        self.vars = {}  # un solo Var por nombre dentro de este programa
+
+    def peek(self): return self.t[self.i] if self.i < len(self.t) else None
+    def pop(self):  val = self.peek(); self.i += 1; return val
+    def expect(self, wanted):
+        got = self.pop()
+        if got != wanted:
+            raise SyntaxError(f"Se esperaba '{wanted}' y llegó '{got}'")
+        return got
+
+    def read_expr_tokens(self, stop_at={";", ")", "ELSE"}):
+        depth = 0
+        acc = []
+        while True:
+            cur = self.peek()
+            if cur is None:
+                break
+            if cur == "(":
+                depth += 1
+            elif cur == ")":
+                if depth == 0:
+                    break
+                depth -= 1
+            if depth == 0 and cur in stop_at:
+                break
+            acc.append(self.pop())
+        return acc
+
+    def read_paren_expr(self):
+        self.expect("(")
+        expr = self.read_expr_tokens(stop_at={")"})
+        self.expect(")")
+        return expr
+
+    def parse_block(self):
+        self.expect("(")
+        stmts = []
+        while True:
+            if self.peek() == ")":
+                self.pop()
+                break
+            stmts.append(self.parse_stmt())
+            if self.peek() == ";":
+                self.pop()
+        return Block(stmts)
+
+    def parse_stmt(self):
+        cur = self.peek()
+        if cur == "PRINT":
+            self.pop()
+            expr = self.read_paren_expr()
+            return Print(Expr(expr, self.vars))
+        if cur == "IF":
+            self.pop()
+            cond = self.read_paren_expr()
+            then_blk = self.parse_block()
+            else_blk = None
+            if self.peek() == "ELSE":
+                self.pop()
+                else_blk = self.parse_block()
+            return If(Expr(cond, self.vars), then_blk, else_blk)
+        if cur == "WHILE":
+            self.pop()
+            cond = self.read_paren_expr()
+            body = self.parse_block()
+            return While(Expr(cond, self.vars), body)
+        if cur == "FOR":
+            self.pop()
+            self.expect("(")
+            init = self.parse_stmt()
+            self.expect(";")
+            cond = self.read_expr_tokens(stop_at={";"})
+            self.expect(";")
+            post = self.parse_stmt()
+            self.expect(")")
+            body = self.parse_block()
+            return For(init, Expr(cond, self.vars), post, body)
+
+        # Asignación: ID = expr
+        left = self.pop()
+        if not isinstance(left, Ident):
+            raise SyntaxError("Se esperaba una sentencia o asignación")
+        self.expect("=")
+        expr = self.read_expr_tokens(stop_at={";", ")", "ELSE"})
+        return Set(left.name, Expr(expr, self.vars))
+
+    def parse_program(self):
+        prog = []
+        while self.peek() is not None:
+            prog.append(self.parse_stmt())
+            if self.peek() == ";":
+                self.pop()
+        return Block(prog)
@@ -0,0 +1,379 @@
+# ==============================
+# Dibujo de resultados sin Tk
+# ==============================
+# El dibujo por dígitos se hace en dos etapas:
+# 1) layout: valor -> lista de figuras (círculos, líneas, polígonos) con coordenadas.
+# 2) salida: la misma lista se pinta en un canvas Tk, se pasa a SVG o se rasteriza
+#    a PPM/PBM en Python puro.
+#
+# Reglas por dígito (igual que la GUI):
+# - 0 => círculo vacío (borde blanco, sin relleno).
+# - 1 => círculo naranja RELLENO.
+# - 2 => línea naranja (trazo).
+# - 3..9 => polígonos naranjas RELLENOS.
+#
+# Si los dígitos no caben en el ancho (celdas de 80 px) se dibujan los primeros y
+# los últimos con una marca de tres puntos en medio: el lienzo nunca crece sin
+# límite, ni en Tk, ni en SVG, ni en raster.
+#
+# Uso en lote (sin display):
+#   python -m shapelang.render prog1.txt prog2.txt -o imagenes -f svg ppm
+
+import math
+import os
+import sys
+
+from .salida import int_to_str
+
+ORANGE = "#FFA500"  # color naranja
+BACKGROUND = "black"
+CELL = 80           # ancho mínimo de celda por dígito
+MAX_WIDTH = 2000    # ancho máximo del lienzo automático (fit_width)
+
+# ---------- Layout ----------
+def regular_polygon_points(cx, cy, r, n, rotation_deg=-90):
+    pts = []
+    rot = math.radians(rotation_deg)
+    for k in range(n):
+        ang = rot + 2 * math.pi * k / n
+        x = cx + r * math.cos(ang)
+        y = cy + r * math.sin(ang)
+        pts.extend([x, y])
+    return pts
+
+def digit_shapes(d, cx, cy, size):
+    """Figuras de la 'figura-dígito' centrada en (cx,cy). Cada figura es una tupla:
+      ("circle", cx, cy, r, fill, outline, width)
+      ("line", x1, y1, x2, y2, color, width)
+      ("polygon", pts, fill, outline, width)   con pts = [x0, y0, x1, y1, ...]
+    """
+    r = size * 0.35
+    if d is None:
+        # marca de dígitos omitidos: tres puntos blancos
+        return [("circle", cx + k * size * 0.2, cy, size * 0.05, "white", "white", 1)
+                for k in (-1, 0, 1)]
+    if d == 0:
+        # círculo vacío: borde blanco
+        return [("circle", cx, cy, r, None, "white", 2)]
+    if d == 1:
+        # círculo naranja relleno
+        return [("circle", cx, cy, r, ORANGE, ORANGE, 2)]
+    if d == 2:
+        # línea naranja
+        length = size * 0.7
+        return [("line", cx - length/2, cy, cx + length/2, cy, ORANGE, 5)]
+    if 3 <= d <= 9:
+        # n-gono naranja relleno
+        return [("polygon", regular_polygon_points(cx, cy, r, d), ORANGE, ORANGE, 2)]
+    # fuera de rango (no debería ocurrir al ir dígito a dígito)
+    return []
+
+def value_text(val, drawable=None):
+    """Decimal de |val| a dibujar y avisos para el usuario. Devuelve (texto o None, avisos).
+    drawable viene de infer_types (True = int probado) y es solo una pista: se fija
+    al compilar y el entorno puede cambiar antes de ejecutar, así que el atajo solo
+    se toma si además val es exactamente int; si no, se comprueba todo."""
+    avisos = []
+    if not (drawable is True and type(val) is int):
+        if isinstance(val, bool):
+            return None, ["[Aviso] Resultado booleano: no se dibuja polígono."]
+
+        if isinstance(val, float):
+            if abs(val - round(val)) < 1e-9:
+                val = int(round(val))
+
+        if not isinstance(val, int):
+            return None, ["[Aviso] Resultado no entero: no se dibuja polígono."]
+
+    # Para negativos: avisamos y usamos valor absoluto para dibujar
+    if val < 0:
+        avisos.append("[Aviso] Valor negativo: se dibuja usando valor absoluto.")
+        val = abs(val)
+
+    return int_to_str(val), avisos
+
+def text_digits(texto, w=None):
+    """Decimal -> lista de dígitos; con w, recortada a lo que cabe (ver fit_digits).
+    Devuelve (dígitos, avisos)."""
+    avisos = []
+    if w is not None:
+        texto, avisos = fit_digits(texto, w)
+    return [None if ch is None else int(ch) for ch in texto], avisos
+
+def value_digits(val, drawable=None, w=None):
+    """Dígitos a dibujar para val y avisos para el usuario. Devuelve (dígitos o None, avisos).
+    Con w se recortan ya aquí los dígitos que no caben."""
+    texto, avisos = value_text(val, drawable)
+    if texto is None:
+        return None, avisos
+    digits, recorte = text_digits(texto, w)
+    return digits, avisos + recorte
+
+def max_cells(w):
+    """Cuántas celdas de CELL px caben en un lienzo de ancho w (al menos 3)."""
+    return max(3, (w - 40) // CELL)
+
+def fit_digits(digits, w):
+    """Recorta los dígitos que no caben en w: deja los primeros y los últimos con
+    None (la marca) en medio. Devuelve (dígitos, avisos)."""
+    n, cells = len(digits), max_cells(w)
+    if n <= cells:
+        return digits, []
+    tail = (cells - 1) // 2
+    head = cells - 1 - tail
+    aviso = (f"[Aviso] Valor con {n} dígitos: se dibujan solo los primeros ({head}) "
+             f"y los últimos ({tail}).")
+    return list(digits[:head]) + [None] + list(digits[n - tail:]), [aviso]
+
+def layout_digits(digits, w=400, h=300):
+    """Reparte los dígitos en celdas centradas en un lienzo w x h."""
+    shapes = []
+    digits, _ = fit_digits(digits, w)
+    n = len(digits)
+    cell_w = min(160, max(CELL, (w - 40) // max(1, n)))
+    size = cell_w
+    total_w = n * cell_w
+    start_x = (w - total_w) / 2 + cell_w / 2
+    cy = h / 2
+
+    for idx, d in enumerate(digits):
+        cx = start_x + idx * cell_w
+        shapes.extend(digit_shapes(d, cx, cy, size))
+    return shapes
+
+def layout_value(val, w=400, h=300, drawable=None):
+    """Layout completo de un valor: (figuras, avisos)."""
+    digits, avisos = value_digits(val, drawable, w)
+    if digits is None:
+        return [], avisos
+    return layout_digits(digits, w, h), avisos
+
+def fit_width(n_digits, min_w=400, max_w=MAX_WIDTH):
+    """Ancho de lienzo para que entren n dígitos en celdas de CELL px, hasta max_w."""
+    return min(max_w, max(min_w, n_digits * CELL + 40))
+
+def render(shapes, sink):
+    """Pasa cada figura al método del sink con su nombre (circle/line/polygon)."""
+    for shape in shapes:
+        getattr(sink, shape[0])(*shape[1:])
+    return sink
+
+# ---------- Salida: canvas Tk ----------
+class TkSink:
+    def __init__(self, canvas):
+        self.canvas = canvas
+
+    def circle(self, cx, cy, r, fill, outline, width):
+        self.canvas.create_oval(cx - r, cy - r, cx + r, cy + r,
+                                fill=fill if fill else "",
+                                outline=outline if outline else "",
+                                width=width)
+
+    def line(self, x1, y1, x2, y2, color, width):
+        self.canvas.create_line(x1, y1, x2, y2, fill=color, width=width, capstyle="round")
+
+    def polygon(self, pts, fill, outline, width):
+        self.canvas.create_polygon(pts, fill=fill, outline=outline if outline else fill,
+                                   width=width)
+
+# ---------- Salida: SVG ----------
+class SvgSink:
+    def __init__(self, w, h, background=BACKGROUND):
+        self.w, self.h = w, h
+        self.parts = [f'<rect width="{w}" height="{h}" fill="{background}"/>']
+
+    def circle(self, cx, cy, r, fill, outline, width):
+        self.parts.append(f'<circle cx="{cx:.2f}" cy="{cy:.2f}" r="{r:.2f}" '
+                          f'fill="{fill or "none"}" stroke="{outline or "none"}" '
+                          f'stroke-width="{width}"/>')
+
+    def line(self, x1, y1, x2, y2, color, width):
+        self.parts.append(f'<line x1="{x1:.2f}" y1="{y1:.2f}" x2="{x2:.2f}" y2="{y2:.2f}" '
+                          f'stroke="{color}" stroke-width="{width}" stroke-linecap="round"/>')
+
+    def polygon(self, pts, fill, outline, width):
+        coords = " ".join(f"{pts[i]:.2f},{pts[i + 1]:.2f}" for i in range(0, len(pts), 2))
+        self.parts.append(f'<polygon points="{coords}" fill="{fill}" '
+                          f'stroke="{outline or fill}" stroke-width="{width}"/>')
+
+    def text(self):
+        return (f'<svg xmlns="http://www.w3.org/2000/svg" width="{self.w}" height="{self.h}" '
+                f'viewBox="0 0 {self.w} {self.h}">\n' + "\n".join(self.parts) + "\n</svg>\n")
+
+# ---------- Salida: raster PPM / PBM ----------
+COLORS = {"black": (0, 0, 0), "white": (255, 255, 255)}
+
+def parse_color(c):
+    if c in COLORS:
+        return bytes(COLORS[c])
+    return bytes.fromhex(c.lstrip("#"))
+
+class RasterSink:
+    """Rasterizador mínimo: rellena por filas (muestreando el centro de cada píxel)."""
+
+    def __init__(self, w, h, background=BACKGROUND):
+        self.w, self.h = int(w), int(h)
+        self.bg = parse_color(background)
+        self.pixels = bytearray(self.bg * (self.w * self.h))
+
+    def _span(self, y, x0, x1, rgb):
+        """Pinta los píxeles de la fila y cuyo centro cae en [x0, x1]."""
+        if not 0 <= y < self.h:
+            return
+        a = max(0, math.ceil(x0 - 0.5))
+        b = min(self.w - 1, math.floor(x1 - 0.5))
+        if a <= b:
+            row = y * self.w
+            self.pixels[(row + a) * 3:(row + b + 1) * 3] = rgb * (b - a + 1)
+
+    def _rows(self, y0, y1):
+        return range(max(0, math.floor(y0)), min(self.h, math.ceil(y1) + 1))
+
+    def circle(self, cx, cy, r, fill, outline, width):
+        if fill:
+            rgb = parse_color(fill)
+            for y in self._rows(cy - r, cy + r):
+                dy = y + 0.5 - cy
+                if dy * dy <= r * r:
+                    dx = math.sqrt(r * r - dy * dy)
+                    self._span(y, cx - dx, cx + dx, rgb)
+        if outline and width:
+            # anillo entre r - width/2 y r + width/2
+            rgb = parse_color(outline)
+            ro, ri = r + width / 2, max(0.0, r - width / 2)
+            for y in self._rows(cy - ro, cy + ro):
+                dy = y + 0.5 - cy
+                if dy * dy > ro * ro:
+                    continue
+                dxo = math.sqrt(ro * ro - dy * dy)
+                if dy * dy < ri * ri:
+                    dxi = math.sqrt(ri * ri - dy * dy)
+                    self._span(y, cx - dxo, cx - dxi, rgb)
+                    self._span(y, cx + dxi, cx + dxo, rgb)
+                else:
+                    self._span(y, cx - dxo, cx + dxo, rgb)
+
+    def line(self, x1, y1, x2, y2, color, width):
+        """Trazo grueso con extremos redondeados (cápsula)."""
+        rgb = parse_color(color)
+        hw = width / 2
+        vx, vy = x2 - x1, y2 - y1
+        len2 = vx * vx + vy * vy
+        x_lo, x_hi = max(0, math.floor(min(x1, x2) - hw)), min(self.w, math.ceil(max(x1, x2) + hw) + 1)
+        for y in self._rows(min(y1, y2) - hw, max(y1, y2) + hw):
+            py = y + 0.5
+            for x in range(x_lo, x_hi):
+                px = x + 0.5
+                t = ((px - x1) * vx + (py - y1) * vy) / len2 if len2 else 0.0
+                t = min(1.0, max(0.0, t))
+                ex, ey = px - (x1 + t * vx), py - (y1 + t * vy)
+                if ex * ex + ey * ey <= hw * hw:
+                    i = (y * self.w + x) * 3
+                    self.pixels[i:i + 3] = rgb
+
+    def polygon(self, pts, fill, outline, width):
+        xs, ys = pts[0::2], pts[1::2]
+        n = len(xs)
+        rgb = parse_color(fill)
+        for y in self._rows(min(ys), max(ys)):
+            py = y + 0.5
+            cuts = []
+            for i in range(n):
+                xa, ya, xb, yb = xs[i], ys[i], xs[i - 1], ys[i - 1]
+                if (ya <= py < yb) or (yb <= py < ya):
+                    cuts.append(xa + (py - ya) * (xb - xa) / (yb - ya))
+            cuts.sort()
+            for k in range(0, len(cuts) - 1, 2):
+                self._span(y, cuts[k], cuts[k + 1], rgb)
+        if outline and width:
+            for i in range(n):
+                self.line(xs[i - 1], ys[i - 1], xs[i], ys[i], outline, width)
+
+    def ppm(self):
+        return b"P6\n%d %d\n255\n" % (self.w, self.h) + bytes(self.pixels)
+
+    def pbm(self):
+        """Monocromo: 1 (negro) donde hay figura, 0 (blanco) en el fondo."""
+        w, row_bytes = self.w, (self.w + 7) // 8
+        # por canal: 1 si el byte difiere del fondo; luego OR de los tres canales
+        tables = [bytes(int(v != c) for v in range(256)) for c in self.bg]
+        to_ascii = bytes.maketrans(b"\x00\x01", b"01")
+        pad = b"0" * (row_bytes * 8 - w)
+        out = [b"P4\n%d %d\n" % (w, self.h)]
+        for y in range(self.h):
+            row = self.pixels[y * w * 3:(y + 1) * w * 3]
+            mask = 0
+            for c in range(3):
+                mask |= int.from_bytes(row[c::3].translate(tables[c]), "big")
+            bits = mask.to_bytes(w, "big").translate(to_ascii) + pad
+            out.append(int(bits, 2).to_bytes(row_bytes, "big"))
+        return b"".join(out)
+
+# ---------- Lote ----------
+FORMATS = ("svg", "ppm", "pbm")
+
+def write_images(shapes, w, h, base, formats):
+    """Escribe base.<formato> para cada formato a partir de un mismo layout."""
+    raster = None
+    for fmt in formats:
+        if fmt == "svg":
+            data = render(shapes, SvgSink(w, h)).text().encode("utf-8")
+        else:
+            if raster is None:
+                raster = render(shapes, RasterSink(w, h))
+            data = raster.ppm() if fmt == "ppm" else raster.pbm()
+        with open(f"{base}.{fmt}", "wb") as f:
+            f.write(data)
+
+def main(argv=None):
+    import argparse
+    from .interpreter import Interpreter
+
+    class _Captura(Interpreter):
+        """Intérprete que no imprime: solo se queda con el último PRINT."""
+        last = None
+
+        def emit(self, val, drawable=None):
+            self.last = (val, drawable)
+
+    ap = argparse.ArgumentParser(description="Dibuja el último PRINT de cada programa en archivos.")
+    ap.add_argument("programas", nargs="+", help="archivos con programas de figuras")
+    ap.add_argument("-o", "--salida", default=".", help="carpeta de salida")
+    ap.add_argument("-f", "--formatos", nargs="+", choices=FORMATS, default=["svg"])
+    ap.add_argument("--ancho", type=int, default=None,
+                    help=f"ancho fijo (por defecto según los dígitos, hasta {MAX_WIDTH})")
+    ap.add_argument("--alto", type=int, default=300)
+    args = ap.parse_args(argv)
+
+    os.makedirs(args.salida, exist_ok=True)
+    fallos = 0
+    for ruta in args.programas:
+        nombre = os.path.splitext(os.path.basename(ruta))[0]
+        try:
+            with open(ruta, "r", encoding="utf-8") as f:
+                vm = _Captura()
+                vm.run(f.read())
+        except Exception as e:
+            print(f"{ruta}: Error: {e}", file=sys.stderr)
+            fallos += 1
+            continue
+        if vm.last is None:
+            print(f"{ruta}: [Info] No se ha llamado a PRINT: no hay resultado para dibujar.",
+                  file=sys.stderr)
+            texto, avisos = None, []
+        else:
+            texto, avisos = value_text(*vm.last)
+        # el ancho sale del número de dígitos; la lista solo se arma con los que caben
+        w = args.ancho or fit_width(len(texto) if texto else 1)
+        digits = None
+        if texto is not None:
+            digits, recorte = text_digits(texto, w)
+            avisos += recorte
+        for aviso in avisos:
+            print(f"{ruta}: {aviso}", file=sys.stderr)
+        shapes = layout_digits(digits, w, args.alto) if digits else []
+        write_images(shapes, w, args.alto, os.path.join(args.salida, nombre), args.formatos)
+    return 1 if fallos else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,113 @@
+# ==============================
+# Salida rápida de enteros enormes
+# ==============================
+# str(int) es cuadrático y desde Python 3.11 falla (ValueError) pasados 4300
+# dígitos. Aquí:
+# - int_to_str: divide y vencerás sobre los bits, n = hi * 2^w + lo, recombinando
+#   en decimal.Decimal (multiplicación subcuadrática de libmpdec) con las
+#   potencias 2^w cacheadas. Al final str(Decimal) es lineal.
+#   (Partir por potencias de 10 con divmod no ganaría nada: la división de int
+#   de CPython es cuadrática.)
+# - digit_count: número de dígitos sin convertir (bit_length + una comparación).
+# - write_value: escribe un valor a trozos en un callback tipo file.write, entero
+#   completo ("full"), solo la cuenta de dígitos ("count") o los primeros y
+#   últimos dígitos ("edges").
+
+STR_BITS = 8192      # hasta aquí (~2466 dígitos) str(n) es rápido y está permitido
+DECIMAL_BITS = 128   # hojas de la recursión: se convierten con Decimal(n)
+CHUNK = 1 << 16      # dígitos por llamada a write
+MODES = ("full", "count", "edges")
+
+def int_to_str(n):
+    """Decimal de n sin el límite de 4300 dígitos y en tiempo subcuadrático."""
+    if n.bit_length() <= STR_BITS:
+        return str(n)
+    import decimal  # solo quien imprime enteros enormes paga la importación
+    D = decimal.Decimal
+    pow2 = {}  # w -> Decimal(2**w)
+
+    def w2pow(w):
+        result = pow2.get(w)
+        if result is None:
+            if w <= DECIMAL_BITS:
+                result = D(2) ** w
+            elif w - 1 in pow2:
+                result = pow2[w - 1] * 2
+            else:
+                w2 = w >> 1
+                result = w2pow(w2) * w2pow(w - w2)
+            pow2[w] = result
+        return result
+
+    def inner(n, w):
+        if w <= DECIMAL_BITS:
+            return D(n)
+        w2 = w >> 1
+        hi = n >> w2
+        lo = n - (hi << w2)
+        return inner(lo, w2) + inner(hi, w - w2) * w2pow(w2)
+
+    with decimal.localcontext() as ctx:
+        ctx.prec = decimal.MAX_PREC
+        ctx.Emax = decimal.MAX_EMAX
+        ctx.Emin = decimal.MIN_EMIN
+        ctx.traps[decimal.Inexact] = True  # todo es exacto; si no, que falle
+        if n < 0:
+            result = -inner(-n, n.bit_length())
+        else:
+            result = inner(n, n.bit_length())
+    return str(result)
+
+def digit_count(n):
+    """Número de dígitos decimales de |n| sin convertirlo a texto."""
+    n = abs(n)
+    if n.bit_length() <= STR_BITS:
+        return len(str(n))
+    # log10(2) en float puede fallar por uno: se corrige comparando con 10**k
+    k = int((n.bit_length() - 1) * 0.30102999566398120)
+    p = 10 ** k
+    while p > n:
+        p //= 10
+        k -= 1
+    while p * 10 <= n:
+        p *= 10
+        k += 1
+    return k + 1
+
+def iter_digits(n, chunk=CHUNK):
+    """Trozos de como mucho `chunk` caracteres del decimal de n."""
+    s = int_to_str(n)
+    for i in range(0, len(s), chunk):
+        yield s[i:i + chunk]
+
+def write_value(val, write, mode="full", edge=20, chunk=CHUNK, max_full=None):
+    """Escribe val con write(str) sin salto de línea final. Los int (no bool)
+    siguen `mode`; con max_full, los que pasen de ese número de dígitos se
+    escriben como "edges". Cualquier otro valor se escribe con str()."""
+    if not isinstance(val, int) or isinstance(val, bool):
+        write(str(val))
+        return
+    if mode not in MODES:
+        raise ValueError(f"Modo de salida no soportado: {mode}")
+    if mode == "full" and max_full is None and val.bit_length() <= STR_BITS:
+        write(str(val))
+        return
+    if mode == "count":
+        write(f"<{digit_count(val)} dígitos>")
+        return
+    if mode == "full" and (max_full is None or digit_count(val) <= max_full):
+        for part in iter_digits(val, chunk):
+            write(part)
+        return
+    s = int_to_str(val)
+    ndig = len(s) - (s[0] == "-")
+    if ndig <= 2 * edge:
+        write(s)
+    else:
+        write(f"{s[:edge + (s[0] == '-')]}...{s[-edge:]} ({ndig} dígitos)")
+
+def format_value(val, mode="full", edge=20, max_full=None):
+    """Como write_value, pero devuelve el texto."""
+    parts = []
+    write_value(val, parts.append, mode, edge, max_full=max_full)
+    return "".join(parts)
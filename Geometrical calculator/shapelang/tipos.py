@@ -0,0 +1,103 @@
+# ==============================
+# Inferencia de tipos
+# ==============================
+
+import operator
+
+from .expr import Num, Op, Var
+from .nodes import Block, For, If, Print, Set, While
+
+# ---------- Inferencia de tipos ---------- int / float / bool a partir de literales y operadores
+INT, FLOAT, BOOL = "int", "float", "bool"
+
+# Operaciones especializadas: funciones C de `operator` en lugar de las lambdas
+# genéricas. Solo se usan donde los tipos de ambos operandos están probados.
+OPS_INT = {sym: Op(sym, fn) for sym, fn in (
+    ("+", operator.add), ("-", operator.sub), ("*", operator.mul),
+    ("/", operator.truediv), ("%", operator.mod), ("//", operator.floordiv),
+    ("**", operator.pow), (">", operator.gt), ("<", operator.lt), ("!=", operator.ne))}
+
+def tipo_valor(v):
+    if isinstance(v, bool):
+        return BOOL
+    if isinstance(v, int):
+        return INT
+    if isinstance(v, float):
+        return FLOAT
+    return None
+
+def _tipo_op(sym, ta, tb, b_item):
+    """Tipo del resultado de `a sym b`; None si no se puede probar."""
+    if sym in (">", "<", "!="):
+        return BOOL
+    if ta is None or tb is None:
+        return None
+    if sym == "/":
+        return FLOAT
+    enteros = ta != FLOAT and tb != FLOAT  # bool se comporta como int
+    if sym == "**":
+        # int ** negativo da float; float ** no entero puede dar complejo
+        if enteros:
+            return INT if isinstance(b_item, Num) and b_item.value >= 0 else None
+        return FLOAT if ta == FLOAT and tb != FLOAT else None
+    return INT if enteros else FLOAT
+
+def _tipar_rpn(rpn, vtypes):
+    """Recorre la RPN con una pila de tipos. Devuelve (rpn especializada, tipo)."""
+    out, st = [], []  # st: (tipo, item que lo produjo)
+    for it in rpn:
+        if isinstance(it, Num):
+            st.append((tipo_valor(it.value), it))
+        elif isinstance(it, Var):
+            st.append((vtypes.get(it.name), it))
+        elif len(st) < 2:  # RPN mal formada: ya fallará al evaluarse
+            st = [(None, it)]
+        else:
+            (tb, b_item), (ta, _) = st.pop(), st.pop()
+            if ta in (INT, BOOL) and tb in (INT, BOOL):
+                it = OPS_INT[it.sym]
+            st.append((_tipo_op(it.sym, ta, tb, b_item), it))
+        out.append(it)
+    return tuple(out), (st[-1][0] if st else None)
+
+def _sentencias(node):
+    yield node
+    if isinstance(node, Block):
+        for s in node.stmts:
+            yield from _sentencias(s)
+    elif isinstance(node, If):
+        yield from _sentencias(node.then_blk)
+        if node.else_blk is not None:
+            yield from _sentencias(node.else_blk)
+    elif isinstance(node, While):
+        yield from _sentencias(node.body)
+    elif isinstance(node, For):
+        for s in (node.init, node.post, node.body):
+            yield from _sentencias(s)
+
+def infer_types(ast, env):
+    """Infiere el tipo de cada variable y expresión y especializa sus operaciones.
+    El tipo de una variable es la unión de todas sus asignaciones en el programa y
+    del valor que ya tenga en env; si no coinciden queda sin probar (None) y sus
+    expresiones siguen por el camino genérico. Devuelve {nombre: tipo}."""
+    stmts = list(_sentencias(ast))
+    vtypes = {name: tipo_valor(v) for name, v in env.items()}
+    sets = [s for s in stmts if isinstance(s, Set)]
+    changed = True
+    while changed:  # punto fijo: los tipos solo pueden pasar de concreto a None
+        changed = False
+        for s in sets:
+            _, t = _tipar_rpn(s.expr.rpn, vtypes)
+            if s.name in vtypes and vtypes[s.name] != t:
+                t = None
+            if s.name not in vtypes or vtypes[s.name] != t:
+                vtypes[s.name] = t
+                changed = True
+    for s in stmts:
+        for attr in ("expr", "cond"):
+            e = getattr(s, attr, None)
+            if e is not None:
+                e.rpn, e.type = _tipar_rpn(e.rpn, vtypes)
+        if isinstance(s, Print):
+            s.drawable = {INT: True, BOOL: False}.get(s.expr.type)
+    return vtypes
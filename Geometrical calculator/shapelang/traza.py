@@ -0,0 +1,210 @@
+# ==============================
+# Traza compacta de ejecución
+# ==============================
+# Guarda cada operación de la VM y la pila resultante sin copiar la pila entera
+# en cada paso:
+# - un array de opcodes (1 byte por paso),
+# - deltas de pila: cuántos valores se sacan y qué valor se mete,
+# - una foto completa de la pila al inicio de cada tramo de `intervalo` pasos.
+#
+# Los tramos cerrados van a un buffer circular acotado (max_pasos) o se vuelcan
+# a un archivo. Para ir al paso k se carga un solo tramo y se reaplican como
+# mucho `intervalo` deltas desde su foto.
+#
+# Al cerrar una traza en archivo se vuelca el tramo abierto y se escribe al
+# final un pie con el índice de offsets, así el archivo se puede abrir solo.
+# Tramos y pie van en marshal (como checkpoint.py), con los arrays como bytes:
+# abrir una traza ajena no ejecuta código, a diferencia de pickle.
+#
+# Uso:
+#   with Traza(intervalo=1024, archivo="run.traza") as traza:
+#       Interpreter(traza=traza).run(codigo)
+#   with Traza.abrir("run.traza") as traza:
+#       op, pila = traza.estado(12345)
+
+import marshal
+import struct
+from array import array
+from collections import deque
+
+# Opcodes: empujar número, empujar variable, operadores y FIN (fin de expresión:
+# la pila se vacía y su tope pasa a la sentencia)
+OPCODES = ("NUM", "ID", "+", "-", "*", "/", "%", "//", "**", ">", "<", "!=", "FIN")
+_CODIGO = {op: i for i, op in enumerate(OPCODES)}
+_FIN = _CODIGO["FIN"]
+
+# Cola del archivo: marca + offset del pie (intervalo, pasos, pila, offsets)
+_MAGIA = b"MVTRAZA2"
+_COLA = struct.Struct("<8sQ")
+
+
+def _volcar_tramo(tramo, f):
+    base, foto, ops, pops, vals = tramo
+    marshal.dump((base, foto, ops.tobytes(), pops.tobytes(), vals), f)
+
+def _leer_tramo(f):
+    base, foto, ops, pops, vals = marshal.load(f)
+    a_ops, a_pops = array("B"), array("I")
+    a_ops.frombytes(ops)
+    a_pops.frombytes(pops)
+    return base, foto, a_ops, a_pops, vals
+
+
+class Traza:
+    def __init__(self, intervalo=1024, max_pasos=None, archivo=None):
+        if intervalo < 1:
+            raise ValueError("El intervalo entre fotos debe ser >= 1")
+        self.intervalo = intervalo
+        self.pasos = 0     # pasos registrados en total (incluidos los descartados)
+        self.pila = []     # pila tras el último paso
+
+        # Tramo abierto: foto inicial + deltas desde ella
+        self._base = 0
+        self._foto = ()
+        self._ops = array("B")
+        self._pops = array("I")
+        self._vals = []
+
+        # Tramos cerrados: en disco (índice de offsets) o en memoria (circular)
+        self._archivo = open(archivo, "w+b") if archivo is not None else None
+        self._en_archivo = archivo is not None
+        self._solo_lectura = False
+        self._offsets = array("Q")
+        maxlen = None
+        if max_pasos is not None and not self._en_archivo:
+            maxlen = max(0, max_pasos // intervalo)
+        self._tramos = deque(maxlen=maxlen)
+        self._cache = None  # último tramo leído del archivo
+
+    # ---------- Registro ----------
+    def paso(self, op, npop, val):
+        """Registra una operación que saca `npop` valores y mete `val`."""
+        self._ops.append(_CODIGO[op])
+        self._pops.append(npop)
+        self._vals.append(val)
+        if npop:
+            del self.pila[-npop:]
+        self.pila.append(val)
+        self.pasos += 1
+        if len(self._ops) == self.intervalo:
+            self._cerrar_tramo()
+
+    def fin(self):
+        """Fin de expresión: la pila de la VM se descarta."""
+        self._ops.append(_FIN)
+        self._pops.append(len(self.pila))
+        self._vals.append(None)
+        self.pila.clear()
+        self.pasos += 1
+        if len(self._ops) == self.intervalo:
+            self._cerrar_tramo()
+
+    def _cerrar_tramo(self):
+        tramo = (self._base, self._foto, self._ops, self._pops, self._vals)
+        if self._en_archivo:
+            self._archivo.seek(0, 2)
+            self._offsets.append(self._archivo.tell())
+            _volcar_tramo(tramo, self._archivo)
+        else:
+            self._tramos.append(tramo)
+        self._base = self.pasos
+        self._foto = tuple(self.pila)
+        self._ops = array("B")
+        self._pops = array("I")
+        self._vals = []
+
+    # ---------- Consulta ----------
+    @property
+    def primer_paso(self):
+        """Primer paso que todavía se puede consultar."""
+        if self._en_archivo:
+            return 0
+        base = self._tramos[0][0] if self._tramos else self._base
+        # la foto de un tramo no guarda el opcode del paso que la produjo
+        return base + 1 if base else 0
+
+    def _tramo(self, k):
+        if k > self._base:
+            return (self._base, self._foto, self._ops, self._pops, self._vals)
+        idx = (k - 1) // self.intervalo
+        if self._en_archivo:
+            if self._archivo is None:
+                raise ValueError("Traza cerrada: vuelve a abrirla con Traza.abrir(ruta)")
+            if self._cache is None or self._cache[0] != idx * self.intervalo:
+                self._archivo.seek(self._offsets[idx])
+                self._cache = _leer_tramo(self._archivo)
+            return self._cache
+        return self._tramos[idx - self._tramos[0][0] // self.intervalo]
+
+    def estado(self, k):
+        """Devuelve (opcode, pila) tras el paso k. El paso 0 es la pila vacía inicial."""
+        if not self.primer_paso <= k <= self.pasos:
+            raise IndexError(f"Paso fuera de la traza: {k}")
+        if k == 0:
+            return None, ()
+        base, foto, ops, pops, vals = self._tramo(k)
+        pila = list(foto)
+        for j in range(k - base):
+            if pops[j]:
+                del pila[-pops[j]:]
+            if ops[j] != _FIN:
+                pila.append(vals[j])
+        return OPCODES[ops[k - base - 1]], tuple(pila)
+
+    def __len__(self):
+        return self.pasos
+
+    # ---------- Archivo ----------
+    def cerrar(self):
+        """Vuelca el tramo abierto y el índice al archivo y lo cierra."""
+        if self._archivo is None:
+            return
+        if not self._solo_lectura:
+            if self._ops:
+                self._cerrar_tramo()
+            f = self._archivo
+            f.seek(0, 2)
+            pie = f.tell()
+            marshal.dump((self.intervalo, self.pasos, tuple(self.pila),
+                          self._offsets.tobytes()), f)
+            f.write(_COLA.pack(_MAGIA, pie))
+        self._archivo.close()
+        self._archivo = None
+        self._cache = None
+
+    @classmethod
+    def abrir(cls, ruta):
+        """Abre para consulta una traza escrita y cerrada con archivo=ruta."""
+        f = open(ruta, "rb")
+        try:
+            try:
+                f.seek(-_COLA.size, 2)
+                magia, pie = _COLA.unpack(f.read(_COLA.size))
+            except (OSError, struct.error):
+                magia = None
+            if magia != _MAGIA:
+                raise ValueError(f"{ruta} no es una traza cerrada")
+            f.seek(pie)
+            try:
+                intervalo, pasos, pila, offsets = marshal.load(f)
+            except (EOFError, TypeError, ValueError):
+                raise ValueError(f"{ruta}: pie de traza corrupto") from None
+        except BaseException:
+            f.close()
+            raise
+        traza = cls(intervalo)
+        traza.pasos = pasos
+        traza.pila = list(pila)
+        traza._base = pasos
+        traza._foto = pila
+        traza._archivo = f
+        traza._en_archivo = True
+        traza._solo_lectura = True
+        traza._offsets.frombytes(offsets)
+        return traza
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.cerrar()